@@ -40,13 +40,13 @@ from contextlib import suppress
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, Optional
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 from discord import VoiceClient
 from discord.utils import setup_logging
 from redis.asyncio import Redis
 
 from src.models.serenity import Serenity
-from src.shared import SerenityConfig
+from src.shared import get_config
 
 if TYPE_CHECKING:
     from asyncpg import Pool, Record
@@ -65,10 +65,17 @@ def run_with_suppress(runner: Optional[asyncio.Runner]) -> None:
 
 async def setup() -> tuple[Serenity, Pool[Record], ClientSession]:
     setup_logging()
-    config = SerenityConfig.parse_obj({})
+    config = get_config()
 
     loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
-    session: ClientSession = ClientSession()
+    connector = TCPConnector(
+        limit=100,
+        limit_per_host=32,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+    )
+    session: ClientSession = ClientSession(connector=connector)
 
     try:
         pool: Pool[Record] = await Serenity.create_pool(config.sql_dsn)
@@ -33,14 +33,19 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 
 from __future__ import annotations
 
-from asyncio import to_thread
+from asyncio import gather, get_running_loop, to_thread
+from collections import OrderedDict
+from concurrent.futures import Executor
 from copy import deepcopy
+from hashlib import blake2b
 from io import BytesIO
 from logging import getLogger
+from math import isqrt
 from pathlib import Path
-from typing import Generator
-from uuid import uuid4
+from typing import Generator, Optional, Sequence
 
+import numpy as np
+from numpy.typing import NDArray
 from PIL import Image, UnidentifiedImageError
 
 from .abc import SavableByteStream
@@ -49,17 +54,27 @@ __all__: tuple[str, ...] = ("AvatarPointer", "FilePointer", "AvatarCollage")
 
 _logger = getLogger(__name__)
 _ROOT = Path("images")
+_TILE = (256, 256)
+# Thumbnails only ever show up as small collage tiles, bilinear is indistinguishable
+# from Pillow's bicubic default there at a fraction of the work per pixel.
+_RESAMPLE = Image.Resampling.BILINEAR
+
+# Finished collages keyed by (uid, file count, newest mtime), least recently used first.
+_COLLAGE_CACHE: OrderedDict[tuple[int, int, int], bytes] = OrderedDict()
+_COLLAGE_CACHE_SIZE = 64
 
 
 class FilePointer:
-    __slots__: tuple[str, ...] = ("uid", "root")
+    __slots__: tuple[str, ...] = ("uid", "root", "_paths")
 
     uid: int
     root: Path
+    _paths: Optional[list[Path]]
 
     def __init__(self, uid: int) -> None:
         self.uid = uid
         self.root = _ROOT
+        self._paths = None
 
     @property
     def empty(self) -> bool:
@@ -69,12 +84,23 @@ class FilePointer:
     def current_path(self) -> Path:
         return self.root / str(self.uid)
 
+    def paths(self) -> list[Path]:
+        # A pointer lives for a single command, list the directory once and let the
+        # emptiness check, the collage and the embed all share that snapshot.
+        if self._paths is None:
+            current_path = self.current_path
+            self._paths = (
+                sorted(current_path.iterdir(), key=lambda x: x.stat().st_mtime) if current_path.exists() else []
+            )
+
+        return self._paths
+
     def __iter__(self) -> Generator[Image.Image, None, None]:
-        for file in sorted(self.current_path.iterdir(), key=lambda x: x.stat().st_mtime):
+        for file in self.paths():
             yield Image.open(file)
 
     def __len__(self) -> int:
-        return len(list(self.current_path.iterdir())) if self.current_path.exists() else 0
+        return len(self.paths())
 
     def __repr__(self) -> str:
         return f"<Files uid={self.uid} length={len(self)}>"
@@ -131,37 +157,32 @@ class AvatarPointer:
         return self.root / str(self.uid)
 
     def _save_to_path(self) -> None:
-        if not self.root.exists():
-            self.root.mkdir()
-
-        if not self.current_path.exists():
-            self.current_path.mkdir()
+        # Another save for a different uid may create the root between a check and a mkdir.
+        self.current_path.mkdir(parents=True, exist_ok=True)
 
         try:
             with Image.open(self._file) as image:
-                image = image.resize((256, 256))
-                image = image.resize((256, 256))
-                hash_new = hash(image.tobytes())  # type: ignore
+                # Stored as RGBA so the collage can use the decoded tile as-is.
+                image = (image if image.mode == "RGBA" else image.convert("RGBA")).resize(_TILE, _RESAMPLE)
+                digest = blake2b(image.tobytes(), digest_size=16).hexdigest()
         except UnidentifiedImageError:
             _logger.warning("Unable to open %s's file pointer.", self.uid)
             return
 
-        path_files = list(self.current_path.iterdir())
-        hashes: set[int] = set()
-
-        for file in path_files:
-            with Image.open(file) as _copy:
-                hashes.add(hash(_copy.tobytes()))  # type: ignore
+        # Thumbnails are named after their pixel digest, so spotting a duplicate is
+        # a single lookup instead of decoding every thumbnail we already stored.
+        destination = self.current_path / f"{digest}.png"
 
         # Saves us some space. :)
-        if hash_new in hashes:
+        if destination.exists():
             return
 
+        path_files = list(self.current_path.iterdir())
+
         if len(path_files) >= 100:
             oldest = min(path_files, key=lambda x: x.stat().st_mtime)
-            oldest.unlink()
+            oldest.unlink(missing_ok=True)
 
-        destination = self.current_path / f"{uuid4().hex}.png"
         with destination.open("wb") as file:
             image.save(file, format="PNG")
 
@@ -170,55 +191,92 @@ class AvatarPointer:
 
 
 class AvatarCollage(SavableByteStream):
-    __slots__: tuple[str, ...] = ("_pointer", "x", "y")
+    __slots__: tuple[str, ...] = ("_pointer",)
 
-    x: int
-    y: int
     _pointer: FilePointer
 
     def __init__(self, pointer: FilePointer) -> None:
         self._pointer = pointer
-        self.x = self.y = 0
 
     @property
     def images(self) -> list[Image.Image]:
         return list(self._pointer)
 
-    def _get_grid_size(self) -> int:
-        amount = len(self._pointer)
-        return int(amount**0.5) + 1 if amount**0.5 % 1 else int(amount**0.5)
-
-    def _create_collage(self) -> Image.Image:
-        size = self._get_grid_size()
-        width = height = size * 256
+    @staticmethod
+    def _get_grid_size(amount: int) -> tuple[int, int]:
+        """Returns the (columns, rows) of the smallest near-square grid that fits ``amount`` tiles."""
+        columns = isqrt(amount)
+        columns += columns * columns != amount
+        return columns, -(-amount // columns)
 
-        with Image.new("RGBA", (width, height)) as canvas:
-            fx = fy = 0
+    @staticmethod
+    def _load_tile(path: Path) -> NDArray[np.uint8]:
+        with Image.open(path) as avatar:
+            return np.asarray(avatar if avatar.mode == "RGBA" else avatar.convert("RGBA"))
 
-            for avatar in self._pointer:
-                if self.x == size:
-                    self.y += 1
-                    self.x = 0
+    @staticmethod
+    def _create_collage(tiles: Sequence[NDArray[np.uint8]]) -> Image.Image:
+        if len(tiles) == 1:
+            # A single avatar is already its own collage, there is nothing to lay out.
+            return Image.fromarray(tiles[0], "RGBA")
 
-                x, y = self.x * 256, self.y * 256
-                canvas.paste(avatar, (x, y))
+        columns, rows = AvatarCollage._get_grid_size(len(tiles))
 
-                fx = max(x, fx)
-                fy = max(y, fy)
+        # Each tile is written straight into its slot of the final canvas, which is
+        # allocated at the exact grid size. No oversized canvas, crop or relayout copy.
+        canvas = np.zeros((rows * 256, columns * 256, 4), dtype=np.uint8)
 
-                self.x += 1
+        for index, tile in enumerate(tiles):
+            row, column = divmod(index, columns)
+            canvas[row * 256 : (row + 1) * 256, column * 256 : (column + 1) * 256] = tile
 
-            return canvas.crop((0, 0, fx + 256, fy + 256))
+        return Image.fromarray(canvas, "RGBA")
 
-    async def buffer(self) -> BytesIO:
-        """Returns a BytesIO object of the image."""
+    @staticmethod
+    def _encode(tiles: Sequence[NDArray[np.uint8]]) -> bytes:
         buffer = BytesIO()
-        canvas = await to_thread(self._create_collage)
-
-        canvas.save(buffer, "PNG")
-        buffer.seek(0)
-
-        return buffer
+        AvatarCollage._create_collage(tiles).save(buffer, "WEBP", lossless=False, quality=75, method=0)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _render(paths: Sequence[Path]) -> bytes:
+        """Decodes, lays out and encodes a whole collage, self-contained so it can run in a worker process."""
+        return AvatarCollage._encode([AvatarCollage._load_tile(path) for path in paths])
+
+    async def buffer(self, executor: Optional[Executor] = None) -> BytesIO:
+        """Returns a BytesIO object of the image.
+
+        Parameters
+        ----------
+        executor : `Optional[Executor]`
+            A process pool to render the whole collage in. Without one the tiles
+            are decoded concurrently on the default thread executor instead.
+        """
+        paths = self._pointer.paths()
+        # Paths are ordered by mtime, the newest file changes whenever the history does.
+        key = (self._pointer.uid, len(paths), paths[-1].stat().st_mtime_ns if paths else 0)
+
+        if (cached := _COLLAGE_CACHE.get(key)) is not None:
+            _COLLAGE_CACHE.move_to_end(key)
+            return BytesIO(cached)
+
+        if not paths:
+            raise ValueError(f"No avatars stored for {self._pointer.uid}.")
+
+        if executor is not None:
+            # Keeps decoding and encoding off the interpreter running the gateway,
+            # only the file paths and the encoded result cross the process boundary.
+            data = await get_running_loop().run_in_executor(executor, self._render, paths)
+        else:
+            # Pillow releases the GIL while decoding, so the tiles are decoded side by side.
+            tiles = await gather(*(to_thread(self._load_tile, path) for path in paths))
+            data = await to_thread(self._encode, tiles)
+
+        _COLLAGE_CACHE[key] = data
+        if len(_COLLAGE_CACHE) > _COLLAGE_CACHE_SIZE:
+            _COLLAGE_CACHE.popitem(last=False)
+
+        return BytesIO(data)
 
     def __repr__(self) -> str:
         return f"<Collage uid={self._pointer.uid} length={len(self._pointer)}>"
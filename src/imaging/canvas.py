@@ -39,20 +39,39 @@ from __future__ import annotations
 
 from asyncio import to_thread
 from enum import IntEnum
+from functools import lru_cache
 from io import BytesIO
+from os import urandom
 from pathlib import Path
 from random import randint
 from typing import Any
-from uuid import uuid4
 
 import numpy as np
 from discord import File
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
-from .utils import rgb_to_hex
+from .utils import load_font, rgb_to_hex
 
 __all__: tuple[str, ...] = ("Canvas", "CanvasOption")
 
+_ASCII_CHARS = np.asarray(list(r" .'`^\,:;Il!i><~+_-?][}{1)(|\/tfjrxn" r"uvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"))
+
+
+@lru_cache(maxsize=16)
+def _disc_mask(size: tuple[int, int]) -> Image.Image:
+    """Returns a shared, read-only circular alpha mask filling ``size``."""
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).ellipse((0, 0) + size, fill=255)
+    return mask
+
+
+@lru_cache(maxsize=16)
+def _ring_mask(size: tuple[int, int], px: int) -> Image.Image:
+    """Returns a shared, read-only alpha mask of a ring ``px`` wide along the edge of ``size``."""
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).ellipse((0, 0) + size, outline=255, width=px)
+    return mask
+
 
 class ImageManipulator:
     """A base class for image manipulation."""
@@ -71,25 +90,33 @@ class ImageManipulator:
             new_height = size
             new_width = int((new_height / image.height) * image.width)
 
-        return image.resize((new_width, new_height), Image.ANTIALIAS)
+        # Lets JPEG sources decode at a reduced DCT scale, then reduces in integer steps
+        # before the final resample instead of filtering the full-size image.
+        image.draft(image.mode, (new_width, new_height))
+        return image.resize((new_width, new_height), Image.ANTIALIAS, reducing_gap=3.0)
+
+    @staticmethod
+    def _to_buffer(image: Image.Image, fmt: str = "PNG", **params: Any) -> BytesIO:
+        """Encodes the image into a single rewound buffer that discord.File reads as-is."""
+        if fmt == "PNG":
+            # Every canvas is uploaded once and never stored, fast deflate wins over size.
+            params.setdefault("compress_level", 1)
+
+        buffer = BytesIO()
+        image.save(buffer, format=fmt, **params)
+        buffer.seek(0)
+        return buffer
 
     @staticmethod
     def to_discord_file(buffer: BytesIO, fmt: str = "PNG") -> File:
-        return File(buffer, filename=f"{uuid4()}.{fmt.lower()}")
+        return File(buffer, filename=f"{urandom(16).hex()}.{fmt.lower()}")
 
 
 class PalleteCreator(ImageManipulator):
     def __init__(self, image: bytes) -> None:
         super().__init__(image)
 
-        self.bebas = ImageFont.truetype("static/fonts/BEBAS.ttf", 28)
-
-    @staticmethod
-    def _to_buffer(image: Image.Image) -> BytesIO:
-        buffer = BytesIO()
-        image.save(buffer, format="PNG")
-        buffer.seek(0)
-        return buffer
+        self.bebas = load_font("static/fonts/BEBAS.ttf", 28)
 
     def _create_pallete_canvas(self) -> BytesIO:
         with Image.open(self.image) as canvas:
@@ -136,10 +163,8 @@ class PalleteCreator(ImageManipulator):
 class AsciiCreator(ImageManipulator):
     def __init__(self, image: bytes) -> None:
         super().__init__(image)
-        self.ascii_chars = np.asarray(
-            list(r" .'`^\,:;Il!i><~+_-?][}{1)(|\/tfjrxn" r"uvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$")
-        )
-        self.font = ImageFont.load_default()
+        self.ascii_chars = _ASCII_CHARS
+        self.font = load_font()
 
     def _create_ascii_canvas(
         self,
@@ -157,10 +182,14 @@ class AsciiCreator(ImageManipulator):
         height_in_chars = round(image_scaled.shape[0])
         image_sum = np.sum(image_scaled, axis=2)
         image_sum -= image_sum.min()
-        image_normalized = (1.0 - image_sum / image_sum.max()) ** gamma * (len(self.ascii_chars) - 1)
-        ascii_image = np.array([self.ascii_chars[i] for i in image_normalized.astype(int)])
-        lines = "\n".join("".join(row) for row in ascii_image)
-        new_img_width = letter_width * width_in_chars
+        # Channel sums only take max + 1 distinct values, so the gamma curve is evaluated
+        # once per value into a character lookup table rather than once per pixel.
+        peak = int(image_sum.max()) or 1
+        ramp = (1.0 - np.arange(peak + 1) / peak) ** gamma * (len(self.ascii_chars) - 1)
+        ascii_image = self.ascii_chars[ramp.astype(int)][image_sum]
+        lines = "\n".join(map("".join, ascii_image))
+        # Only the left half of the text block is kept, so never allocate or paint the rest.
+        new_img_width = letter_width * width_in_chars // 2
         new_img_height = letter_height * height_in_chars
 
         with Image.new("RGBA", (new_img_width, new_img_height), background) as new_img:
@@ -171,15 +200,9 @@ class AsciiCreator(ImageManipulator):
                 draw.text((0, y), line, (0, 255, 65), font=self.font)
                 y += letter_height
 
-            left_area = (0, 0, new_img_width // 2, new_img_height)
-            new_img = new_img.crop(left_area)
             new_img = new_img.resize((512, 512), Image.ANTIALIAS)
 
-            buffer = BytesIO()
-            new_img.save(buffer, format="PNG")
-            buffer.seek(0)
-
-            return buffer
+            return self._to_buffer(new_img)
 
     async def to_ascii(self) -> File:
         buffer = await to_thread(self._create_ascii_canvas)
@@ -191,33 +214,18 @@ class PixelateCreator(ImageManipulator):
     def __init__(self, image: bytes) -> None:
         super().__init__(image)
 
-    @staticmethod
-    def shuffle(points: list[tuple[int, int]]) -> None:
-        for i in range(len(points)):
-            j = randint(0, len(points) - 1)
-            points[i], points[j] = points[j], points[i]
-
     def _create_pixel_canvas(self) -> BytesIO:
         with Image.open(self.image) as canvas:
             canvas = self.resize(canvas, 512)
+            pixels = np.asarray(canvas.convert("RGBA"))
 
-            with Image.new("RGBA", canvas.size, (0, 0, 0, 0)) as background:
-                points = []
-
-                for x in range(0, canvas.width, 10):
-                    points.extend((x, y) for y in range(0, canvas.height, 10))
-                self.shuffle(points)
-
-                for point in points:
-                    color = canvas.getpixel(point)
-                    draw = ImageDraw.Draw(background)
-                    draw.rectangle((point, (point[0] + 10, point[1] + 10)), fill=color)
-
-                buffer = BytesIO()
-                background.save(buffer, format="PNG")
-                buffer.seek(0)
+        # Sample the top-left pixel of every 10x10 block and blow it back up,
+        # which is what drawing one rectangle per grid point used to do.
+        height, width = pixels.shape[:2]
+        blocks = pixels[::10, ::10].repeat(10, axis=0).repeat(10, axis=1)[:height, :width]
 
-                return buffer
+        with Image.fromarray(np.ascontiguousarray(blocks), "RGBA") as background:
+            return self._to_buffer(background)
 
     async def to_pixel(self) -> File:
         buffer = await to_thread(self._create_pixel_canvas)
@@ -240,34 +248,31 @@ class TriggerCreator(ImageManipulator):
             invisible = 0, 0, 0, 0
             red_colour = 255, 0, 0, 80
 
-            for _ in range(30):
-                with Image.new("RGBA", square, invisible) as layer:
+            # The red tint and the banner are the same on every frame, so
+            # build them once instead of re-creating and re-decoding per frame.
+            with Image.new("RGBA", square, red_colour) as red, Image.open(self.trigger_path) as triggered:
+                triggered.load()
+
+                for _ in range(30):
+                    layer = Image.new("RGBA", square, invisible)
                     x = -1 * randint(50, 100)
                     y = -1 * randint(50, 100)
                     layer.paste(canvas, (x, y))
-
-                    with Image.new("RGBA", square, red_colour) as red:
-                        layer.paste(red, mask=red)
-
-                    with Image.open(self.trigger_path) as triggered:
-                        layer.paste(triggered, mask=triggered)
+                    layer.paste(red, mask=red)
+                    layer.paste(triggered, mask=triggered)
 
                     frames.append(layer)
 
-            initial_fram = frames[0]
-            buffer = BytesIO()
+            initial_fram, *rest = frames
 
-            initial_fram.save(
-                buffer,
-                format="GIF",
+            return self._to_buffer(
+                initial_fram,
+                "GIF",
                 save_all=True,
                 duration=60,
                 loop=0,
-                append_images=frames,
+                append_images=rest,
             )
-            buffer.seek(0)
-
-            return buffer
 
     async def to_triggerd(self) -> File:
         buffer = await to_thread(self._create_triggered_canvas)
@@ -283,23 +288,12 @@ class PrideCreator(ImageManipulator):
 
     @staticmethod
     def _crop_avatar(avatar: Image.Image) -> Image.Image:
-        with Image.new("L", avatar.size, 0) as mask:
-            draw = ImageDraw.Draw(mask)
-            draw.ellipse((0, 0) + avatar.size, fill=255)
-
-            avatar.putalpha(mask)
-
-            return avatar
+        avatar.putalpha(_disc_mask(avatar.size))
+        return avatar
 
     def _crop_ring(self, ring: Image.Image, px: int) -> Image.Image:
-        with Image.new("L", self.size, 0) as mask:
-            draw = ImageDraw.Draw(mask)
-            draw.ellipse((0, 0) + self.size, fill=255)
-            draw.ellipse((px, px, self.size[0] - px, self.size[1] - px), fill=0)
-
-            ring.putalpha(mask)
-
-            return ring
+        ring.putalpha(_ring_mask(self.size, px))
+        return ring
 
     def _patch_pride(
         self,
@@ -310,11 +304,8 @@ class PrideCreator(ImageManipulator):
         ring = self._crop_ring(ring, pixels)
         avatar.alpha_composite(ring, (0, 0))
 
-        buffer = BytesIO()
-        avatar.save(buffer, format="PNG")
-        buffer.seek(0)
-
-        return buffer
+        # Users keep the result as their profile picture, so it stays lossless.
+        return self._to_buffer(avatar)
 
     def prideavatar(self, option: str, pixels: int) -> BytesIO:
         pixels = max(0, min(512, pixels))
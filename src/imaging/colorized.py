@@ -195,10 +195,5 @@ class ColorRepresentation(SavableByteStream):
         return await asyncio.to_thread(self.raw)
 
     def raw(self) -> io.BytesIO:
-        buffer = io.BytesIO()
-
-        for instruction in self._instructions:
-            buffer.write(instruction)
-
-        buffer.seek(0)
-        return buffer
+        # Sized up front from the finished chunks, rather than growing the buffer write by write.
+        return io.BytesIO(b''.join(self._instructions))
@@ -39,16 +39,80 @@ from __future__ import annotations
 
 import datetime as dt
 from asyncio import to_thread
+from functools import lru_cache
 from io import BytesIO
-from typing import NamedTuple, TypedDict
+from typing import Mapping, NamedTuple, Sequence
 
-import matplotlib.pyplot as plt
 import numpy as np
-from PIL import Image
+from numpy.typing import NDArray
+from PIL import Image, ImageColor, ImageDraw
 
 from .abc import SavableByteStream
+from .utils import load_font
+
+__all__: tuple[str, ...] = ("PresenceEntry", "PresenceGraph")
+
+# Slice order and colour per status, shared by every chart instead of rebuilt per chart.
+_STATUS_COLORS: dict[str, str] = {
+    "Online": "#3ba55d",
+    "Offline": "#747f8d",
+    "Idle": "#faa81a",
+    "Do Not Disturb": "#ed4245",
+}
+
+_CANVAS_SIZE = (730, 500)
+_OUTER_RADIUS = 220
+_DONUT_ORIGIN = (30, 30)
+_LEGEND_X = 500
+_LEGEND_SQUARE = 28
+
+
+@lru_cache(maxsize=None)
+def _donut_geometry(outer: int, width: float) -> tuple[NDArray[np.bool_], NDArray[np.float64], NDArray[np.uint8]]:
+    """Returns the ring mask, the angle of every ring pixel and the alpha of the donut's bounding box.
+
+    None of it depends on the data, so it is computed once and every chart only has to
+    look up which slice each angle belongs to. The alpha is how much of a pixel lies
+    inside the ring, which also anti-aliases both edges.
+    """
+    inner = outer * (1 - width)
+    side = 2 * outer
+
+    yy, xx = np.ogrid[:side, :side]
+    dx = xx + 0.5 - outer
+    dy = yy + 0.5 - outer
+    radius = np.hypot(dx, dy)
+    coverage = np.clip(outer + 0.5 - radius, 0, 1) * np.clip(radius - inner + 0.5, 0, 1)
+
+    alpha = (coverage * 255).astype(np.uint8)
+    ring = alpha > 0
+    # Degrees counter-clockwise from twelve o'clock, where the first slice starts.
+    theta = (np.degrees(np.arctan2(-dx, -dy)) % 360)[ring]
+
+    for array in (ring, theta, alpha):
+        array.flags.writeable = False
+
+    return ring, theta, alpha
+
+
+@lru_cache(maxsize=None)
+def _legend_layer() -> Image.Image:
+    """Returns a blank chart canvas with the status legend already drawn onto it."""
+    canvas = Image.new("RGBA", _CANVAS_SIZE, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(canvas)
+    font = load_font("static/fonts/Lato-Black.ttf", 26)
+    rows = np.linspace(0.1, 0.9, len(_STATUS_COLORS)) * canvas.height
+
+    for y, (status, color) in zip(rows.astype(int), _STATUS_COLORS.items()):
+        draw.rectangle(
+            (_LEGEND_X, y - _LEGEND_SQUARE // 2, _LEGEND_X + _LEGEND_SQUARE, y + _LEGEND_SQUARE // 2),
+            fill=color,
+        )
+        # Centred by hand, text anchors are only supported by TrueType fonts, not the fallback.
+        _, top, _, bottom = font.getbbox(status)
+        draw.text((_LEGEND_X + _LEGEND_SQUARE + 16, y - (top + bottom) // 2), status, fill="white", font=font)
 
-__all__: tuple[str, ...] = ("PresenceEntry", "PresenceHistory", "PresenceGraph")
+    return canvas
 
 
 class PresenceEntry(NamedTuple):
@@ -57,95 +121,59 @@ class PresenceEntry(NamedTuple):
     changed_at: dt.datetime
 
 
-class PresenceHistory(TypedDict):
-    dates: list[dt.datetime]
-    statuses: list[str]
-
-
 class PresenceGraph(SavableByteStream):
     __slots__: tuple[str, ...] = ("_data", "_width", "_mapping", "_avatar", "font")
 
-    _data: PresenceHistory
+    _data: Mapping[str, int]
     _width: float
     _mapping: dict[str, str]
 
-    def __init__(self, data: PresenceHistory) -> None:
+    def __init__(self, data: Mapping[str, int]) -> None:
         self._data = data
         self._width = 0.2
-        self._mapping = {
-            "Online": "#3ba55d",
-            "Offline": "#747f8d",
-            "Idle": "#faa81a",
-            "Do Not Disturb": "#ed4245",
-        }
+        self._mapping = _STATUS_COLORS
 
     @property
-    def data(self) -> PresenceHistory:
+    def data(self) -> Mapping[str, int]:
         return self._data
 
-    def _generate_donut_chart(self) -> BytesIO:
-        statuses = self.data["statuses"]
-        sizes = [statuses.count(status) for status in self._mapping.keys()]
-
-        labels, sorted_sizes = zip(
-            *sorted(
-                zip(self._mapping.keys(), sizes),
-                key=lambda x: list(self._mapping.keys()).index(x[0]),
-            )
-        )
+    def _draw_donut(self, sizes: Sequence[int], colors: Sequence[str]) -> Image.Image:
+        """Colours the precomputed ring by looking up the slice each pixel's angle falls in.
 
-        _, ax = plt.subplots(
-            facecolor="none",
-            figsize=(9, 7),
-        )
+        The lookup result is kept as 8-bit palette indices and only expanded to RGBA by
+        Pillow once, instead of gathering full colour triples in NumPy.
+        """
+        ring, theta, alpha = _donut_geometry(_OUTER_RADIUS, self._width)
 
-        status_labels = list(self._mapping.keys())
-        status_colors = list(self._mapping.values())
-        square_y = np.linspace(0.9, 0.1, len(status_labels))
-        label_y = square_y + 0.035
-
-        for i in range(len(status_labels)):
-            ax.text(  # type: ignore
-                1.60,
-                label_y[i],
-                status_labels[i],
-                ha="left",
-                va="top",
-                color="white",
-            )
-            ax.scatter(  # type: ignore
-                1.45,
-                square_y[i],
-                s=300,
-                c=status_colors[i],
-                marker="s",
-            )
-
-        ax.pie(  # type: ignore
-            sorted_sizes,
-            colors=[self._mapping[label] for label in labels],  # type: ignore
-            wedgeprops=dict(width=self._width, edgecolor="none"),
-            center=(0.25, 0.5),
-            startangle=90,
-            counterclock=True,
-            pctdistance=1.15,
-            textprops=dict(color="white"),
-            radius=1,
-        )
+        bounds = np.cumsum(sizes, dtype=np.float64)
+        bounds *= 360 / bounds[-1]
+
+        indices = np.zeros(alpha.shape, dtype=np.uint8)
+        indices[ring] = np.minimum(np.searchsorted(bounds, theta, side="right"), len(sizes) - 1)
+
+        with Image.fromarray(indices, "P") as paletted:
+            paletted.putpalette([channel for color in colors for channel in ImageColor.getrgb(color)[:3]])
+            donut = paletted.convert("RGBA")
 
-        canvas = BytesIO()
-        plt.savefig(canvas, format="png", facecolor="none", transparent=True)
-        plt.close()
-        canvas.seek(0)
+        donut.putalpha(Image.fromarray(alpha, "L"))
+        return donut
+
+    def _generate_donut_chart(self) -> BytesIO:
+        # Empty statuses take up no angle, so they are left out of the lookup entirely.
+        slices = [(size, color) for status, color in self._mapping.items() if (size := self.data.get(status, 0))]
 
-        with Image.open(canvas) as img:
-            img = img.crop((170, 100, 900, 600))
+        # The legend never changes, so every chart starts from a copy of the pre-rendered layer.
+        with _legend_layer().copy() as canvas:
+            if slices:
+                sizes, colors = zip(*slices)
+                with self._draw_donut(sizes, colors) as donut:
+                    canvas.paste(donut, _DONUT_ORIGIN)
 
             buffer = BytesIO()
-            img.save(buffer, format="png")
+            canvas.save(buffer, format="png", compress_level=1, optimize=False)
             buffer.seek(0)
 
-        return buffer
+            return buffer
 
     async def buffer(self) -> BytesIO:
         return await to_thread(self._generate_donut_chart)
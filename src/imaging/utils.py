@@ -34,9 +34,35 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 from __future__ import annotations
 
 from difflib import get_close_matches
-from typing import Optional
+from functools import lru_cache
+from os import path
+from typing import Optional, Union
 
-__all__: tuple[str, ...] = ("rgb_to_hex", "pride_options", "get_pride_type")
+from PIL import ImageFont
+
+__all__: tuple[str, ...] = ("rgb_to_hex", "pride_options", "get_pride_type", "load_font")
+
+
+@lru_cache(maxsize=None)
+def load_font(font: Optional[str] = None, size: int = 10) -> Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]:
+    """Loads a font once per process, so every image shares the parsed face.
+
+    Parameters
+    ----------
+    font : `Optional[str]`
+        The path of the TrueType font to load, Pillow's default bitmap font if omitted.
+    size : `int`
+        The size of the TrueType font.
+
+    Returns
+    -------
+    `Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]`
+        The loaded font, or the default font if the file doesn't exist.
+    """
+    if font is None or not path.exists(font):
+        return ImageFont.load_default()
+
+    return ImageFont.truetype(font, size)
 
 
 def rgb_to_hex(rgb: tuple[int, int, int]) -> str:
@@ -0,0 +1,13 @@
+/*
+# Lookup indexes
+----------------
+> Every read against the history tables filters on a single user. Without these,
+> each lookup scans the whole table, and the scan grows with every recorded change.
+
+*/
+CREATE INDEX IF NOT EXISTS serenity_user_history_lookup_idx
+    ON serenity_user_history (snowflake, item_name, changed_at DESC);
+
+
+CREATE INDEX IF NOT EXISTS serenity_user_presence_lookup_idx
+    ON serenity_user_presence (snowflake, status);
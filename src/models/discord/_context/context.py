@@ -35,6 +35,7 @@ from __future__ import annotations
 
 import io
 import re
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional
 
 import discord
@@ -48,6 +49,8 @@ if TYPE_CHECKING:
 
 __all__: tuple[str, ...] = ("SerenityContext",)
 
+_MENTION_REGEX = re.compile(r"<@!?([0-9]{15,20})>")
+
 
 class SerenityContext(commands.Context["Serenity"]):
     bot: Serenity
@@ -82,10 +85,23 @@ class SerenityContext(commands.Context["Serenity"]):
         if not isinstance(self.me, (discord.Member, discord.User)):
             raise AssertionError("Typecheck failed.")
 
-        repl = f"@{self.me.display_name}".replace("\\", r"\\")
-        pattern = re.compile(rf" < @!?{self.me.id}>")
+        if "<@" not in self.prefix:
+            return self.prefix
+
+        me_id = self.me.id
+        repl = f"@{self.me.display_name}"
+
+        return _MENTION_REGEX.sub(lambda m: repl if int(m.group(1)) == me_id else m.group(0), self.prefix)
+
+    @cached_property
+    def can_send(self) -> bool:
+        """Whether the bot can send messages in this channel.
 
-        return pattern.sub(repl, self.prefix)
+        Resolving permissions walks the roles and overwrites, so it's done once per context
+        and shared by command processing and error handling.
+        """
+        me = self.guild.me if self.guild is not None else self.me
+        return self.channel.permissions_for(me).send_messages  # type: ignore
 
     @property
     def session(self) -> ClientSession:
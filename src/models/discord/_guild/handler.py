@@ -41,6 +41,7 @@ from .model import SerenityGuild
 
 if TYPE_CHECKING:
     from asyncpg import Pool, Record
+    from asyncpg.pool import PoolConnectionProxy
 
 
 __all__: tuple[str, ...] = ("SerenityGuildManager",)
@@ -51,6 +52,10 @@ class SerenityGuildManager:
         self.pool = pool
 
     async def get_guild(self, snowflake: int, /) -> Optional[SerenityGuild]:
+        async with self.pool.acquire() as conn:
+            return await self._fetch_guild(conn, snowflake)
+
+    async def _fetch_guild(self, conn: PoolConnectionProxy[Record], snowflake: int, /) -> Optional[SerenityGuild]:
         query = """
             SELECT
                 serenity_guilds.snowflake AS snowflake,
@@ -67,13 +72,15 @@ class SerenityGuildManager:
                 serenity_guilds.snowflake
         """
 
-        async with self.pool.acquire() as conn:
-            async with conn.transaction(readonly=True):
-                record = await conn.fetchrow(query, snowflake)
+        record = await conn.fetchrow(query, snowflake)
 
         return None if record is None else SerenityGuild.from_record(record)
 
     async def create_guild(self, snowflake: int, /) -> SerenityGuild:
+        async with self.pool.acquire() as conn:
+            return await self._insert_guild(conn, snowflake)
+
+    async def _insert_guild(self, conn: PoolConnectionProxy[Record], snowflake: int, /) -> SerenityGuild:
         query = """
             INSERT INTO serenity_guilds 
                 (snowflake)
@@ -82,9 +89,8 @@ class SerenityGuildManager:
             RETURNING *
         """
 
-        async with self.pool.acquire() as conn:
-            async with conn.transaction():
-                record = await conn.fetchrow(query, snowflake)
+        async with conn.transaction():
+            record = await conn.fetchrow(query, snowflake)
 
         if record is None:
             raise ExceptionFactory.create_error_exception("Failed to create guild")
@@ -106,10 +112,12 @@ class SerenityGuildManager:
                 await conn.execute(query, guild.banned, guild.counting_prefix, guild.id)
 
     async def get_or_create_guild(self, snowflake: int, /) -> SerenityGuild:
-        guild = await self.get_guild(snowflake)
+        # Look up and create on one connection, a miss shouldn't cost a second checkout.
+        async with self.pool.acquire() as conn:
+            guild = await self._fetch_guild(conn, snowflake)
 
-        if guild is None:
-            guild = await self.create_guild(snowflake)
+            if guild is None:
+                guild = await self._insert_guild(conn, snowflake)
 
         return guild
 
@@ -140,8 +148,7 @@ class SerenityGuildManager:
         """
 
         async with self.pool.acquire() as conn:
-            async with conn.transaction(readonly=True):
-                records = await conn.fetch(query)
+            records = await conn.fetch(query)
 
         return [SerenityGuild.from_record(record) for record in records]
 
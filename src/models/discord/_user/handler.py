@@ -41,6 +41,7 @@ from .model import CountingSettings, SerenityUser
 
 if TYPE_CHECKING:
     from asyncpg import Pool, Record
+    from asyncpg.pool import PoolConnectionProxy
 
 __all__: tuple[str, ...] = ("SerenityUserManager",)
 
@@ -50,6 +51,10 @@ class SerenityUserManager:
         self.pool = pool
 
     async def get_user(self, snowflake: int, /) -> Optional[SerenityUser]:
+        async with self.pool.acquire() as conn:
+            return await self._fetch_user(conn, snowflake)
+
+    async def _fetch_user(self, conn: PoolConnectionProxy[Record], snowflake: int, /) -> Optional[SerenityUser]:
         query = """
             SELECT
                 u.*, s.counter_message, s.hunt_battle_message
@@ -60,13 +65,15 @@ class SerenityUserManager:
                 u.snowflake = $1
         """
 
-        async with self.pool.acquire() as conn:
-            async with conn.transaction(readonly=True):
-                record = await conn.fetchrow(query, snowflake)
+        record = await conn.fetchrow(query, snowflake)
 
         return None if record is None else SerenityUser.from_record(record)
 
     async def create_user(self, snowflake: int, /) -> SerenityUser:
+        async with self.pool.acquire() as conn:
+            return await self._insert_user(conn, snowflake)
+
+    async def _insert_user(self, conn: PoolConnectionProxy[Record], snowflake: int, /) -> SerenityUser:
         query = """
             INSERT INTO serenity_users 
                 (snowflake)
@@ -75,9 +82,8 @@ class SerenityUserManager:
             RETURNING *
         """
 
-        async with self.pool.acquire() as conn:
-            async with conn.transaction():
-                record = await conn.fetchrow(query, snowflake)
+        async with conn.transaction():
+            record = await conn.fetchrow(query, snowflake)
 
         if record is None:
             raise ExceptionFactory.create_error_exception("Failed to create user")
@@ -115,10 +121,12 @@ class SerenityUserManager:
                 )
 
     async def get_or_create_user(self, snowflake: int, /) -> SerenityUser:
-        user = await self.get_user(snowflake)
+        # Look up and create on one connection, a miss shouldn't cost a second checkout.
+        async with self.pool.acquire() as conn:
+            user = await self._fetch_user(conn, snowflake)
 
-        if user is None:
-            user = await self.create_user(snowflake)
+            if user is None:
+                user = await self._insert_user(conn, snowflake)
 
         return user
 
@@ -143,7 +151,6 @@ class SerenityUserManager:
         """
 
         async with self.pool.acquire() as conn:
-            async with conn.transaction(readonly=True):
-                records = await conn.fetch(query)
+            records = await conn.fetch(query)
 
         return [SerenityUser.from_record(record) for record in records]
@@ -49,6 +49,7 @@ __all__: tuple[str, ...] = ("MaybeMemberConverter",)
 
 
 ID_REGEX = re.compile(r'([0-9]{15,20})$')
+MENTION_REGEX = re.compile(r'<@!?([0-9]{15,20})>$')
 
 
 class MaybeMemberConverter(commands.Converter[discord.Member]):
@@ -281,7 +282,7 @@ class MaybeMemberConverter(commands.Converter[discord.Member]):
         result = None
         user_id = None
 
-        match = self.get_id_match(argument) or re.match(r'<@!?([0-9]{15,20})>$', argument)
+        match = self.get_id_match(argument) or MENTION_REGEX.match(argument)
 
         if match is None:
             result = self.get_member_named(argument, guild) or self.get_member_from_guilds(
@@ -35,9 +35,11 @@ from __future__ import annotations
 
 import asyncio
 import re
+from concurrent.futures import ProcessPoolExecutor
 from functools import cached_property
 from logging import Logger, getLogger
-from typing import TYPE_CHECKING, Any, Coroutine, Self, Type, TypeVar, Union
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any, Self, Type, TypeVar, Union
 
 import discord
 import orjson
@@ -48,7 +50,6 @@ from redis.asyncio import Redis
 from typing_extensions import override
 
 from src import __author__, __version__
-from src.interfaces import GuildMessagable
 from src.models.discord import (
     INTENTS,
     ExponentialBackoff,
@@ -60,7 +61,7 @@ from src.models.discord import (
     SerenityUser,
 )
 from src.models.discord._bot.cache import SerenityUserCache
-from src.shared import ExceptionFactory, SerenityConfig
+from src.shared import ExceptionFactory, get_config
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -71,7 +72,7 @@ if TYPE_CHECKING:
 
 __all__: tuple[str, ...] = ("Serenity", "SerenityT")
 
-_config = SerenityConfig.parse_obj({})
+_config = get_config()
 _logger = getLogger(__name__)
 
 SerenityT = TypeVar("SerenityT", bound="Serenity", covariant=True)
@@ -109,6 +110,10 @@ class Serenity(SerenityMixin, commands.Bot):
         self._pool = pool
         self._redis = redis
 
+        # CPU heavy image work that shouldn't share the GIL with the gateway. Workers are
+        # spawned rather than forked, forking a process with live threads isn't safe.
+        self.process_pool = ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn"))
+
         self.ws: Any
 
     @cached_property
@@ -153,6 +158,12 @@ class Serenity(SerenityMixin, commands.Bot):
             if init is not None:
                 await init(conn)
 
+        # Keep idle connections (and their prepared statements) open instead of reconnecting after five minutes.
+        kwargs.setdefault("min_size", 5)
+        kwargs.setdefault("max_size", 20)
+        kwargs.setdefault("max_inactive_connection_lifetime", 0)
+        kwargs.setdefault("max_cached_statement_lifetime", 0)
+
         pool: Pool[Any] | None = await create_pool(*args, init=_init, **kwargs)
 
         if pool is None:
@@ -173,25 +184,16 @@ class Serenity(SerenityMixin, commands.Bot):
     ) -> SerenityContext:
         return await super().get_context(message, cls=cls or commands.Context[Self])
 
-    async def gather_and_log(self, coros: list[Coroutine[Any, Any, Any]], what: str) -> list[Any]:
-        results = await asyncio.gather(*coros, return_exceptions=True)
-
-        for _, r in zip(coros, results):
-            if isinstance(r, Exception):
-                self.logger.error(f"Failed to {what} with error: {r}")
-            else:
-                self.logger.info(f"Successfully loaded {what}.")
-
-        return results
-
     @override
     async def setup_hook(self) -> None:
-        await asyncio.gather(
-            *[
-                self.gather_and_log([self.load_extension(ext)], f"{ext!r}")
-                for ext in (list(self.walk_plugins()) + ["jishaku"])
-            ],
-        )
+        extensions = (*self.walk_plugins(), "jishaku")
+        results = await asyncio.gather(*map(self.load_extension, extensions), return_exceptions=True)
+
+        for ext, result in zip(extensions, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Failed to load {ext!r} with error: {result!r}")
+            else:
+                self.logger.info(f"Successfully loaded {ext!r}.")
 
         for file in self.walk_schemas():
             # Not using gather here to ensure that the schemas
@@ -202,8 +204,11 @@ class Serenity(SerenityMixin, commands.Bot):
             except Exception as e:
                 self.logger.error(f"Failed to load schema {file.name!r} with error: {e}")
 
-        users = await self.model_manager.gather_users()
-        guilds = await self.model_manager.gather_guilds()
+        # Both caches come from independent tables, warm them on two connections at once.
+        users, guilds = await asyncio.gather(
+            self.model_manager.gather_users(),
+            self.model_manager.gather_guilds(),
+        )
 
         self.user_cache.insert_many(*users)
         self.cached_guilds.update({guild.id: guild for guild in guilds})
@@ -254,6 +259,9 @@ class Serenity(SerenityMixin, commands.Bot):
 
     def set_guild(self, guild: SerenityGuild) -> None:
         self.cached_guilds[guild.id] = guild
+        # The compiled prefix pattern is derived from the guild's prefixes, drop it
+        # so get_prefix rebuilds it from the new state on the next message.
+        self.cached_prefixes.pop(guild.id, None)
 
     @override
     async def start(self, *args: Any, **kwargs: Any) -> None:
@@ -272,10 +280,12 @@ class Serenity(SerenityMixin, commands.Bot):
             return
 
         if ctx.guild:
-            if not isinstance(ctx.channel, GuildMessagable) or not isinstance(ctx.me, discord.Member):
+            # A runtime Protocol isinstance check inspects every protocol member on each call,
+            # probing the one attribute we rely on is enough to rule out odd channel types.
+            if getattr(ctx.channel, "guild", None) is None or not isinstance(ctx.me, discord.Member):
                 return
 
-            if not ctx.channel.permissions_for(ctx.me).send_messages:
+            if not ctx.can_send:
                 if await self.is_owner(ctx.author):
                     await ctx.author.send("I don't have permission to send messages in that channel.")
 
@@ -293,6 +303,7 @@ class Serenity(SerenityMixin, commands.Bot):
     async def close(self) -> None:
         to_close = (self.pool, self.session, self.redis)
         asyncio.gather(*[resource.close() for resource in to_close if resource])
+        self.process_pool.shutdown(wait=False, cancel_futures=True)
 
         await super().close()
 
@@ -33,8 +33,12 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 
 from __future__ import annotations
 
-from logging import getLogger
-from typing import Awaitable, Callable, Dict, Optional, ParamSpec, Tuple, Type, TypeVar, Union
+from collections import Counter
+from functools import lru_cache
+from logging import ERROR, getLogger
+from time import monotonic
+from types import MappingProxyType
+from typing import Awaitable, Callable, Dict, Mapping, Optional, ParamSpec, Sequence, Tuple, Type, TypeVar, Union
 
 from discord import HTTPException
 from discord.ext import commands
@@ -59,9 +63,40 @@ ErrorT = TypeVar('ErrorT', bound=commands.CommandError)
 MaybeCoro = Union[T, Awaitable[T]]
 MaybeCoroFunc = Callable[P, 'MaybeCoro[T]']
 
-EXCEPTION_HANDLERS: Dict[
+# Permission names are snake_case, quote errors wrap the offending character in single quotes.
+_PERMISSION_TABLE = str.maketrans("_", " ")
+_QUOTE_TABLE = str.maketrans("'", "`")
+# Who is missing the permissions, resolved through the exception MRO.
+_MISSING_PERMISSIONS_SUBJECT: Dict[Type[commands.CommandError], str] = {
+    commands.BotMissingPermissions: "I'm",
+    commands.MissingPermissions: "You're",
+}
+
+# Seconds during which repeats of the same unhandled error are counted instead of logged.
+_ERROR_LOG_WINDOW = 10.0
+_LAST_LOGGED: Dict[Tuple[str, Type[BaseException]], float] = {}
+_SUPPRESSED_ERRORS: Counter[Tuple[str, Type[BaseException]]] = Counter()
+
+
+def _join_many(perms: Sequence[str]) -> str:
+    return "`, `".join(perms[:-1]) + f"`, and `{perms[-1]}"
+
+
+# English joiners specialised by arity, anything longer goes through `_join_many`.
+_PERMISSION_JOINERS: Tuple[Callable[[Sequence[str]], str], ...] = (
+    lambda perms: "",
+    lambda perms: perms[0],
+    lambda perms: f"{perms[0]}` and `{perms[1]}",
+    lambda perms: f"{perms[0]}`, `{perms[1]}`, and `{perms[2]}",
+)
+
+_EXCEPTION_HANDLERS: Dict[
     Type[commands.CommandError], Callable[[SerenityContext, commands.CommandError], Union[str, None]]
 ] = {}
+# Read-only outside of `register_handler`, which also clears the resolution cache.
+EXCEPTION_HANDLERS: Mapping[
+    Type[commands.CommandError], Callable[[SerenityContext, commands.CommandError], Union[str, None]]
+] = MappingProxyType(_EXCEPTION_HANDLERS)
 
 
 def register_handler(
@@ -129,7 +164,10 @@ def register_handler(
         for the specified exception type(s).
         """
         for exc in exc_type:
-            EXCEPTION_HANDLERS[exc] = func
+            _EXCEPTION_HANDLERS[exc] = func
+
+        # A new handler can shadow a base class handler that was already resolved.
+        _resolve_handler.cache_clear()
 
         return func
 
@@ -163,17 +201,28 @@ def get_handler(
     In this example, the `handler_func` variable will contain the exception handler function
     for the `commands.CommandNotFound` exception type, if one exists.
     """
-    chain = type(exc_type).__mro__
+    return _resolve_handler(type(exc_type))
 
-    try:
-        return next(filter(None, map(EXCEPTION_HANDLERS.get, chain)))
-    except StopIteration:
-        return None
+
+@lru_cache(maxsize=None)
+def _resolve_handler(
+    cls: Type[commands.CommandError],
+) -> Optional[Callable[[SerenityContext, commands.CommandError], Union[str, None]]]:
+    """Walks the MRO of an exception class once, later lookups for the same class hit the cache."""
+    for base in cls.__mro__:
+        handler = _EXCEPTION_HANDLERS.get(base)
+
+        if handler is not None:
+            return handler
+
+    return None
 
 
 def get_message(
     ctx: SerenityContext,
     exc: commands.CommandError,
+    *,
+    silent: bool = False,
 ) -> Union[str, None]:
     """
     Returns the error message for the specified exception, using the appropriate exception
@@ -185,6 +234,9 @@ def get_message(
         The context of the command that raised the exception.
     exc : `commands.CommandError`
         The exception to get the error message for.
+    silent : `bool`
+        Whether the message would be discarded anyway, e.g. because the bot can't send
+        messages in the channel. Only handlers with side effects are run in that case.
 
     Returns
     -------
@@ -204,7 +256,11 @@ def get_message(
     """
     handler = get_handler(exc)
 
-    return handler(ctx, exc) if handler is not None else None
+    # null_handler always returns nothing, skip the call for the most common errors.
+    if handler is None or handler is null_handler or (silent and handler not in _SIDE_EFFECT_HANDLERS):
+        return None
+
+    return handler(ctx, exc)
 
 
 @register_handler(commands.CommandNotFound, commands.CheckFailure, commands.DisabledCommand)
@@ -228,14 +284,25 @@ def command_error_handler(
     ctx: SerenityContext,
     exc: commands.CommandError,
 ) -> Optional[str]:
-    if ctx.command is None:
+    if ctx.command is None or not logger.isEnabledFor(ERROR):
         return None
 
+    # Only the first traceback per window is formatted, repeats are counted.
+    key = (ctx.command.qualified_name, type(getattr(exc, "original", exc)))
+    now = monotonic()
+
+    if now - _LAST_LOGGED.get(key, float("-inf")) < _ERROR_LOG_WINDOW:
+        _SUPPRESSED_ERRORS[key] += 1
+        return None
+
+    _LAST_LOGGED[key] = now
+
     logger.exception(
-        "Unhandled error in command %s for user %s (%d):",
+        "Unhandled error in command %s for user %s (%d), %d similar suppressed:",
         ctx.command.qualified_name,
         ctx.author,
         ctx.author.id,
+        _SUPPRESSED_ERRORS.pop(key, 0),
         exc_info=exc,
     )
 
@@ -249,14 +316,15 @@ async def cooldown_handler(
 ) -> None:
     bot = ctx.bot
 
-    if await bot.redis.exists(f"{ctx.author.id}:RateLimit:Command"):
-        return None
-
-    await bot.redis.setex(
+    # SET NX only writes when the key is absent, so checking and arming the
+    # rate limit is one atomic round trip.
+    if not await bot.redis.set(
         name=f"{ctx.author.id}:RateLimit:Command",
-        time=int(exc.retry_after) + 1,
         value="command cooldown",
-    )
+        ex=int(exc.retry_after) + 1,
+        nx=True,
+    ):
+        return None
 
     try:
         return await ctx.message.add_reaction("\N{SNAIL}")
@@ -325,15 +393,16 @@ def missing_permissions_handler(
 ) -> str:
     perms = exc.missing_permissions
 
-    if len(perms) <= 2:
-        formatted = "` and `".join(perms)
-    else:
-        formatted = "`, `".join(perms[:-1]) + f"`, and `{perms[-1]}`"
+    count = len(perms)
+    formatted = _PERMISSION_JOINERS[count](perms) if count < len(_PERMISSION_JOINERS) else _join_many(perms)
 
     s = "s" if len(perms) > 1 else ""
-    missing = formatted.replace("_", " ").replace("guild", "server")
+    missing = formatted.translate(_PERMISSION_TABLE).replace("guild", "server")
 
-    me_or_you = "I\'m" if isinstance(exc, commands.BotMissingPermissions) else "You\'re"
+    me_or_you = next(
+        (_MISSING_PERMISSIONS_SUBJECT[cls] for cls in type(exc).__mro__ if cls in _MISSING_PERMISSIONS_SUBJECT),
+        "You're",
+    )
 
     return f"{me_or_you} missing the `{missing}` permission{s} required to run this command."
 
@@ -352,7 +421,7 @@ def quote_error_handler(
     error_message = str(exc)
     stop = "" if error_message.endswith(".") else "."
 
-    return f"{error_message}{stop}".replace("\'", "`")
+    return f"{error_message}{stop}".translate(_QUOTE_TABLE)
 
 
 @register_handler(commands.NoPrivateMessage)
@@ -369,3 +438,18 @@ def bad_union_argument_handler(
     exc: commands.BadUnionArgument,
 ) -> str:
     return ExceptionFactory.create_critical_exception(str(exc)).to_string()
+
+
+# Handlers that log or react, these still have to run when the message itself can't be sent.
+_SIDE_EFFECT_HANDLERS = frozenset((command_error_handler, cooldown_handler, conversion_error_handler))
+
+
+def _warm_handler_cache(cls: Type[commands.CommandError]) -> None:
+    """Resolves the handler of every known command error up front, so dispatch never walks an MRO."""
+    _resolve_handler(cls)
+
+    for subclass in cls.__subclasses__():
+        _warm_handler_cache(subclass)
+
+
+_warm_handler_cache(commands.CommandError)
@@ -65,8 +65,8 @@ class Errors(Plugin):
         if not ctx.guild or hasattr(ctx.command, "on_error"):
             return
 
-        hint = await maybe_coroutine(get_message, ctx, error)
-        send = ctx.channel.permissions_for(ctx.guild.me).send_messages
+        send = ctx.can_send
+        hint = await maybe_coroutine(get_message, ctx, error, silent=not send)
 
         if send and hint is not None:
             try:
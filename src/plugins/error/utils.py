@@ -33,7 +33,8 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 
 from __future__ import annotations
 
-from re import sub
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable, Tuple, Union
 
 from discord.ext import commands
@@ -56,6 +57,37 @@ INTERNAL_EXCEPTION = ExceptionFactory.create_critical_exception(
 ).to_string()
 
 
+@lru_cache(maxsize=256)
+def _usage_pattern(name: str) -> re.Pattern[str]:
+    """Compiles the pattern matching a parameter in a command signature, once per parameter name."""
+    return re.compile(fr'(\s*[<\[]{re.escape(name)}[.=\w]*[>\]]\s*)')
+
+
+@lru_cache(maxsize=512)
+def _highlight_usage(signature: str, name: str) -> str:
+    """Wraps the parameter's token in the signature, together with its surrounding whitespace, in bold.
+
+    Keyed on the signature text itself, so a reloaded command with a changed signature
+    simply misses the cache instead of serving a stale rendering.
+    """
+    # Plain `<name>` and `[name]` tokens cover nearly every signature and need no regex at all.
+    for token in (f'<{name}>', f'[{name}]'):
+        start = signature.find(token)
+
+        if start == -1:
+            continue
+
+        end = start + len(token)
+        while start and signature[start - 1].isspace():
+            start -= 1
+        while end < len(signature) and signature[end].isspace():
+            end += 1
+
+        return f'{signature[:start]}`**`\u200b{signature[start:end]}\u200b`**`{signature[end:]}'
+
+    return _usage_pattern(name).sub('`**`\u200b\\1\u200b`**`', signature)
+
+
 def converter_name(converter: Union[Callable[..., Any], commands.Converter[Any]]) -> str:
     """
     Returns the name of a `commands.Converter`.
@@ -100,10 +132,8 @@ def get_failed_param(ctx: SerenityContext) -> commands.Parameter:
     if ctx.command is None:
         raise commands.CommandError(INTERNAL_EXCEPTION)
 
-    params = tuple(ctx.command.params.values())
-    handles = (*ctx.args, *ctx.kwargs.values())
-
-    return params[len(handles) - 2]
+    # ctx.args also holds the cog and the context, which aren't part of `params`.
+    return tuple(ctx.command.params.values())[len(ctx.args) + len(ctx.kwargs) - 2]
 
 
 def get_raisable_context(ctx: SerenityContext) -> Tuple[commands.Parameter, str]:
@@ -150,11 +180,7 @@ def get_raisable_context(ctx: SerenityContext) -> Tuple[commands.Parameter, str]
     name = ctx.command.qualified_name
     prefix = ctx.clean_prefix
 
-    usage = sub(
-        fr'(\s*[<\[]{param.name}[.=\w]*[>\]]\s*)',
-        '`**`\u200b\\1\u200b`**`',
-        ctx.command.signature,
-    )
+    usage = _highlight_usage(ctx.command.signature, param.name)
     usage = usage.rstrip('`') if usage.endswith('`') else f'{usage}`'
 
     signature = f'\n\nUsage: `{prefix}{name} {usage}\n' f"Type `{prefix}help {name}` for more information."
@@ -32,17 +32,25 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 """
 from __future__ import annotations
 
-from asyncio import sleep
+from asyncio import QueueFull, sleep
 from logging import Logger, getLogger
+from time import monotonic
 from typing import Any, Optional, Union
 
 import discord
 
+from src.imaging import PresenceEntry
+from src.models.discord import ExponentialBackoff
 from src.shared import SerenityQueue
 
-from .utils import AssetEntity, PresenceEntitiy, get_image_mime_type
+from .utils import AssetEntity, get_image_mime_type
 
-__all__: tuple[str, ...] = ("EventExtensionMixin",)
+__all__: tuple[str, ...] = ("EventExtensionMixin", "PRESENCE_RATELIMIT")
+
+# Discord's CDN recovers from a 5xx within seconds, retry a few times before dropping the asset.
+_AVATAR_READ_ATTEMPTS = 5
+_ASSET_QUEUE_SIZE = 1024
+PRESENCE_RATELIMIT = 5
 
 
 class EventExtensionMixin:
@@ -50,50 +58,92 @@ class EventExtensionMixin:
 
     asset_queue: SerenityQueue[AssetEntity]
     asset_channel: Optional[discord.TextChannel]
-    presence_queue: SerenityQueue[PresenceEntitiy]
+    presence_queue: SerenityQueue[PresenceEntry]
     presence_queue_active: bool
 
+    _dropped_assets: int
     _logger: Logger
+    _loggers: dict[str, Logger]
+    _presence_ratelimit: dict[int, float]
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        self.asset_queue = SerenityQueue()
+        self.asset_queue = SerenityQueue(maxsize=_ASSET_QUEUE_SIZE)
         self.asset_channel = None
         self.presence_queue = SerenityQueue()
         self.presence_queue_active = False
 
+        self._dropped_assets = 0
         self._logger = getLogger(__name__)
+        self._loggers = {}
+        self._presence_ratelimit = {}
 
     def get_logger(self, event_name: str) -> Logger:
-        return self._logger.getChild(event_name)
+        try:
+            return self._loggers[event_name]
+        except KeyError:
+            logger = self._loggers[event_name] = self._logger.getChild(event_name)
+            return logger
+
+    def is_presence_ratelimited(self, snowflake: int) -> bool:
+        """Check the in-process presence rate limit before asking redis."""
+        expires_at = self._presence_ratelimit.get(snowflake)
+        return expires_at is not None and expires_at > monotonic()
+
+    def mark_presence_ratelimited(self, snowflake: int) -> None:
+        self._presence_ratelimit[snowflake] = monotonic() + PRESENCE_RATELIMIT
+
+    def prune_presence_ratelimit(self) -> None:
+        now = monotonic()
+        self._presence_ratelimit = {
+            snowflake: expires_at for snowflake, expires_at in self._presence_ratelimit.items() if expires_at > now
+        }
 
     async def read_avatar_asset(self, target: Union[discord.User, discord.Member]) -> Optional[bytes]:
         """Read the avatar asset for the given target."""
         logger = self.get_logger("read_avatar_asset")
-
-        try:
-            return await target.display_avatar.read()
-        except discord.HTTPException as exc:
-            if exc.status in {403, 404}:
-                # Discord has forsaken us
-                return None
-
-            if exc.status >= 500:
-                await sleep(60)
-                return await self.read_avatar_asset(target)
-
-            logger.exception(
-                "An error occurred while reading the avatar asset for %s (%d)",
-                target,
-                target.id,
-                exc_info=exc,
-            )
-
-            return None
-
-    async def push_asset(self, snowflake: int, *, asset: bytes) -> None:
+        backoff = ExponentialBackoff(5)
+
+        for attempt in range(1, _AVATAR_READ_ATTEMPTS + 1):
+            try:
+                return await target.display_avatar.read()
+            except discord.HTTPException as exc:
+                if exc.status in {403, 404}:
+                    # Discord has forsaken us
+                    return None
+
+                if exc.status < 500:
+                    logger.exception(
+                        "An error occurred while reading the avatar asset for %s (%d)",
+                        target,
+                        target.id,
+                        exc_info=exc,
+                    )
+
+                    return None
+
+                if attempt < _AVATAR_READ_ATTEMPTS:
+                    await sleep(backoff.delay())
+
+        logger.warning(
+            "Giving up on the avatar asset for %s (%d) after %d attempts",
+            target,
+            target.id,
+            _AVATAR_READ_ATTEMPTS,
+        )
+        return None
+
+    async def push_asset(self, snowflake: int, *, asset: bytes) -> bool:
+        """Queue ``asset`` for archiving, returns ``False`` once the queue is full."""
         mime = get_image_mime_type(asset)
 
         if mime is None:
-            return
+            return True
+
+        try:
+            # Never suspend the gateway handler on a full queue, drop the avatar instead.
+            self.asset_queue.put_nowait(AssetEntity(snowflake, asset, mime))
+        except QueueFull:
+            self._dropped_assets += 1
+            return False
 
-        await self.asset_queue.put(AssetEntity(snowflake, asset, mime))
+        return True
@@ -33,18 +33,19 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 
 from __future__ import annotations
 
-from asyncio import QueueEmpty, sleep
+from asyncio import Semaphore, gather
 from io import BytesIO
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Sequence
 
 import discord
 from discord.ext import tasks
 from typing_extensions import override
 
+from src.imaging import PresenceEntry
 from src.shared import Plugin
 
-from ._base import EventExtensionMixin
-from .utils import PRESENCE_STATUS, AssetEntity, PresenceEntitiy
+from ._base import PRESENCE_RATELIMIT, EventExtensionMixin
+from .utils import PRESENCE_STATUS, AssetEntity
 
 if TYPE_CHECKING:
     from src.models.serenity import Serenity
@@ -52,6 +53,38 @@ if TYPE_CHECKING:
 
 __all__: tuple[str, ...] = ("Events",)
 
+# Batches are passed as one array per column, so each statement stays a single prepared plan.
+_USER_INSERT = """
+    INSERT INTO
+        serenity_users (snowflake, created_at)
+    SELECT
+        *
+    FROM
+        unnest($1::bigint[], $2::timestamptz[])
+    ON CONFLICT DO NOTHING
+"""
+
+_USER_HISTORY_INSERT = """
+    INSERT INTO
+        serenity_user_history (snowflake, item_name, item_value)
+    VALUES
+        ($1, $2, $3)
+"""
+
+_USER_PRESENCE_INSERT = """
+    INSERT INTO
+        serenity_user_presence (snowflake, status, changed_at)
+    SELECT
+        *
+    FROM
+        unnest($1::bigint[], $2::text[], $3::timestamptz[])
+"""
+
+# Transcript uploads all share one channel's rate limit bucket.
+_TRANSCRIPT_UPLOAD_CONCURRENCY = 4
+
+_AVATAR_FETCH_CONCURRENCY = 32
+
 
 class Events(EventExtensionMixin, Plugin):
     @override
@@ -63,53 +96,90 @@ class Events(EventExtensionMixin, Plugin):
     @override
     async def cog_load(self) -> None:
         self.empty_asset_queue.start()
+        self.empty_presence_queue.start()
 
     @override
     async def cog_unload(self) -> None:
         self.empty_asset_queue.stop()
+        self.empty_presence_queue.stop()
 
-    async def send_to_transcript(self, asset: AssetEntity) -> None:
-        logger = self.get_logger("send_to_transcript")
+    def in_other_guild(self, member: discord.Member) -> bool:
+        """Cheaper ``len(member.mutual_guilds) > 1``, stops at the first other guild."""
+        guild_id, member_id = member.guild.id, member.id
 
-        if self.asset_channel is None:
-            channel = await self.serenity.fetch_channel(self.serenity.config.TS_CHANNEL_ID)
+        return any(guild.id != guild_id and guild.get_member(member_id) is not None for guild in self.serenity.guilds)
 
-            if not isinstance(channel, discord.TextChannel):
-                raise TypeError("Expected a text channel got %s", type(channel))
+    async def resolve_asset_channel(self) -> discord.TextChannel:
+        channel_id = self.serenity.config.TS_CHANNEL_ID
+        # Only hit the HTTP API when the channel isn't cached.
+        channel = self.serenity.get_channel(channel_id) or await self.serenity.fetch_channel(channel_id)
 
-            self.asset_channel = channel
+        if not isinstance(channel, discord.TextChannel):
+            raise TypeError("Expected a text channel got %s", type(channel))
+
+        self.asset_channel = channel
+        return channel
+
+    @Plugin.listener("on_ready")
+    async def ready_event(self) -> None:
+        # Re-resolved on every reconnect so we never hold a stale channel object.
+        try:
+            await self.resolve_asset_channel()
+        except (TypeError, discord.HTTPException):
+            self.get_logger("ready_event").exception("Unable to resolve the transcript channel")
+
+    async def send_to_transcript(self, channel: discord.TextChannel, asset: AssetEntity) -> Optional[str]:
+        """Post ``asset`` to the archive channel and return the attachment URL."""
+        logger = self.get_logger("send_to_transcript")
 
         try:
             file = discord.File(
                 BytesIO(asset.image_data),
                 filename=f"{asset.snowflake}.{asset.mime_type.split('/')[1]}",
             )
-            message = await self.asset_channel.send(f"Now archiving {asset.snowflake}", file=file)
-        except (ValueError, discord.HTTPException) as exc:
+            message = await channel.send(f"Now archiving {asset.snowflake}", file=file)
+        except (ValueError, discord.HTTPException):
             logger.exception("Failed to archive asset %s", asset.snowflake)
+            return None
 
-            if isinstance(exc, discord.HTTPException):
-                raise exc from None
+        return message.attachments[0].url
 
+    async def archive_assets(self, assets: Sequence[AssetEntity]) -> None:
+        """Post every asset to the transcript and record the URLs with a single COPY."""
+        logger = self.get_logger("archive_assets")
+
+        try:
+            channel = self.asset_channel or await self.resolve_asset_channel()
+        except (TypeError, discord.HTTPException):
+            logger.exception("Unable to resolve the transcript channel, dropping %d assets", len(assets))
             return
 
-        await self.serenity.get_or_create_user(asset.snowflake)
+        semaphore = Semaphore(_TRANSCRIPT_UPLOAD_CONCURRENCY)
 
-        insert_statement = """
-            INSERT INTO
-                serenity_user_history (snowflake, item_name, item_value)
-            VALUES
-                ($1, $2, $3)
-        """
+        async def upload(asset: AssetEntity) -> Optional[str]:
+            async with semaphore:
+                return await self.send_to_transcript(channel, asset)
 
-        first_attachment = message.attachments[0]
+        records: list[tuple[int, str, str]] = []
+
+        for asset, url in zip(assets, await gather(*(upload(asset) for asset in assets), return_exceptions=True)):
+            if isinstance(url, BaseException):
+                logger.error("Failed to archive asset %s", asset.snowflake, exc_info=url)
+            elif url is not None:
+                records.append((asset.snowflake, "avatar", url))
+
+        if not records:
+            return
+
+        # History rows reference serenity_users, make sure every owner exists first.
+        for snowflake in {snowflake for snowflake, _, _ in records}:
+            await self.serenity.get_or_create_user(snowflake)
 
         async with self.serenity.pool.acquire() as connection:
-            await connection.execute(
-                insert_statement,
-                asset.snowflake,
-                "avatar",
-                first_attachment.url,
+            await connection.copy_records_to_table(
+                "serenity_user_history",
+                records=records,
+                columns=("snowflake", "item_name", "item_value"),
             )
 
     @tasks.loop(minutes=1)
@@ -117,65 +187,72 @@ class Events(EventExtensionMixin, Plugin):
         logger = self.get_logger("empty_asset_queue")
         logger.debug("Emptying asset queue")
 
-        while not self.asset_queue.empty():
-            try:
-                asset = self.asset_queue.get_nowait()
-            except QueueEmpty:
-                break
+        assets = self.asset_queue.drain()
 
-            logger.debug("Pushing asset %s to IO", asset.snowflake)
-            await asset.to_pointer().save()
+        if self._dropped_assets:
+            logger.warning("Asset queue was full, dropped %d avatars since the last flush", self._dropped_assets)
+            self._dropped_assets = 0
 
-            await sleep(1.5)
-            await self.send_to_transcript(asset)
+        if not assets:
+            return
+
+        logger.debug("Pushing %s assets to IO", len(assets))
+
+        owned: dict[int, list[AssetEntity]] = {}
+        for asset in assets:
+            owned.setdefault(asset.snowflake, []).append(asset)
+
+        async def save_serially(pending: list[AssetEntity]) -> None:
+            # Saves for one uid share a directory, keep them in order.
+            for asset in pending:
+                try:
+                    await asset.to_pointer().save()
+                except Exception:
+                    logger.exception("Failed to save asset for %s", asset.snowflake)
+
+        await gather(*(save_serially(pending) for pending in owned.values()))
+
+        await self.archive_assets(assets)
 
     @tasks.loop(minutes=5)
     async def empty_presence_queue(self) -> None:
         logger = self.get_logger("empty_presence_queue")
+        self.prune_presence_ratelimit()
 
         if self.presence_queue_active:
             logger.debug("Presence queue is active, skipping")
             return
 
-        self.presence_queue_active = True
-
-        while not self.presence_queue.empty():
-            try:
-                presences = await self.presence_queue.get_many(40)
-            except QueueEmpty:
-                break
+        presences = self.presence_queue.drain()
 
-            logger.info("Pushing %s presences to our database", len(presences))
+        if not presences:
+            return
 
-            insert_statement = """
-                INSERT INTO
-                    serenity_user_presence (snowflake, status, changed_at)
-                VALUES
-                    ($1, $2, $3)
-            """
+        self.presence_queue_active = True
+        logger.info("Pushing %s presences to our database", len(presences))
 
+        try:
             async with self.serenity.pool.acquire() as connection:
-                await connection.executemany(
-                    insert_statement,
-                    ((p.snowflake, p.status, p.changed_at) for p in presences),
+                await connection.execute(
+                    _USER_PRESENCE_INSERT,
+                    [p.snowflake for p in presences],
+                    [p.status for p in presences],
+                    [p.changed_at for p in presences],
                 )
-
-        self.presence_queue_active = False
+        finally:
+            self.presence_queue_active = False
 
     async def dump_members(self, *members: discord.Member) -> None:
-        insert_statement = """
-            INSERT INTO
-                serenity_users (snowflake, created_at)
-            VALUES
-                ($1, $2)
-            ON CONFLICT DO NOTHING
-        """
         created_at = discord.utils.utcnow()
 
+        if not members:
+            return
+
         async with self.serenity.pool.acquire() as connection:
-            await connection.executemany(
-                insert_statement,
-                ((member.id, created_at) for member in members),
+            await connection.execute(
+                _USER_INSERT,
+                [member.id for member in members],
+                [created_at] * len(members),
             )
 
     async def dump_user_history(
@@ -183,18 +260,12 @@ class Events(EventExtensionMixin, Plugin):
         before: discord.User,
         after: discord.User,
     ) -> None:
-        insert_statement = """
-            INSERT INTO
-                serenity_user_history (snowflake, item_name, item_value)
-            VALUES
-                ($1, $2, $3)
-        """
         await self.serenity.get_or_create_user(after.id)
 
         async with self.serenity.pool.acquire() as connection:
             if before.name != after.name:
                 await connection.execute(
-                    insert_statement,
+                    _USER_HISTORY_INSERT,
                     after.id,
                     "name",
                     after.name,
@@ -202,7 +273,7 @@ class Events(EventExtensionMixin, Plugin):
 
             if before.discriminator != after.discriminator:
                 await connection.execute(
-                    insert_statement,
+                    _USER_HISTORY_INSERT,
                     after.id,
                     "discriminator",
                     after.discriminator,
@@ -216,22 +287,31 @@ class Events(EventExtensionMixin, Plugin):
         if guild.id not in self.serenity.cached_guilds:
             await self.serenity.get_or_create_guild(guild.id)
 
-        members = await guild.chunk() if guild.chunked else guild.members
+        members = guild.members if guild.chunked else await guild.chunk()
+        eligible = [member for member in members if member.id != guild.me.id and not self.in_other_guild(member)]
 
-        for member in members:
-            if len(member.mutual_guilds) > 1 or member.id == guild.me.id:
-                continue
+        semaphore = Semaphore(_AVATAR_FETCH_CONCURRENCY)
+        queue_full = False
 
-            asset = await self.read_avatar_asset(member)
+        async def fetch(member: discord.Member) -> None:
+            nonlocal queue_full
 
-            if asset is not None:
-                await self.push_asset(member.id, asset=asset)
+            async with semaphore:
+                if queue_full:
+                    return
+
+                asset = await self.read_avatar_asset(member)
+
+                if asset is not None and not await self.push_asset(member.id, asset=asset):
+                    queue_full = True
+
+        await gather(*(fetch(member) for member in eligible))
 
         await self.dump_members(*members)
 
     @Plugin.listener("on_member_join")
     async def new_member_event(self, member: discord.Member) -> None:
-        if member.id == member.guild.me.id or len(member.mutual_guilds) > 1:
+        if member.id == member.guild.me.id or self.in_other_guild(member):
             return
 
         asset = await self.read_avatar_asset(member)
@@ -243,7 +323,7 @@ class Events(EventExtensionMixin, Plugin):
 
     @Plugin.listener("on_member_update")
     async def member_update_event(self, before: discord.Member, after: discord.Member) -> None:
-        if before.id == before.guild.me.id or len(before.mutual_guilds) > 1 or before.avatar == after.avatar:
+        if before.id == before.guild.me.id or self.in_other_guild(before) or before.avatar == after.avatar:
             return
 
         asset = await self.read_avatar_asset(after)
@@ -268,14 +348,18 @@ class Events(EventExtensionMixin, Plugin):
         if before.status == after.status:
             return
 
-        if await self.serenity.redis.exists(f"{after.id}:RateLimit:PresenceUpdate"):
+        if self.is_presence_ratelimited(after.id):
             return
 
-        await self.serenity.redis.setex(
+        if not await self.serenity.redis.set(
             name=f"{after.id}:RateLimit:PresenceUpdate",
-            time=5,
             value="Ratelimit reached for presence update",
-        )
+            ex=PRESENCE_RATELIMIT,
+            nx=True,
+        ):
+            return
+
+        self.mark_presence_ratelimited(after.id)
 
         if self.serenity.user_cache.get(after.id) is None:
             await self.serenity.get_or_create_user(after.id)
@@ -283,7 +367,7 @@ class Events(EventExtensionMixin, Plugin):
         if not (status := PRESENCE_STATUS.get(after.status)):
             return
 
-        await self.presence_queue.put(PresenceEntitiy(after.id, status, discord.utils.utcnow()))
+        await self.presence_queue.put(PresenceEntry(after.id, status, discord.utils.utcnow()))
 
     @Plugin.listener("on_message")
     async def message_event(self, message: discord.Message) -> None:
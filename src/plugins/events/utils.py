@@ -33,7 +33,6 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 
 from __future__ import annotations
 
-from datetime import datetime
 from io import BytesIO
 from typing import NamedTuple, Optional, Tuple
 
@@ -44,11 +43,11 @@ from src.imaging import AvatarPointer
 
 __all__: Tuple[str, ...] = (
     "PRESENCE_STATUS",
-    "PresenceEntitiy",
     "AssetEntity",
     "get_image_mime_type",
 )
 
+_MIME_HEADER_SIZE = 4096
 
 PRESENCE_STATUS = {
     discord.Status.online: "Online",
@@ -58,12 +57,6 @@ PRESENCE_STATUS = {
 }
 
 
-class PresenceEntitiy(NamedTuple):
-    snowflake: int
-    status: str
-    changed_at: datetime
-
-
 class AssetEntity(NamedTuple):
     snowflake: int
     image_data: bytes
@@ -74,7 +67,9 @@ class AssetEntity(NamedTuple):
 
 
 def get_image_mime_type(data: bytes) -> Optional[str]:
-    mime = from_buffer(data, mime=True)
+    # Every format we accept is identified by its leading magic bytes. Handing libmagic only
+    # the header keeps the sniff constant time, even for multi-megabyte animated avatars.
+    mime = from_buffer(data[:_MIME_HEADER_SIZE], mime=True)
 
     if mime in ("image/png", "image/jpeg", "image/gif", "image/webp"):
         return mime
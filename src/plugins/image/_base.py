@@ -33,8 +33,8 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 
 from __future__ import annotations
 
+from secrets import token_urlsafe
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
 import discord
 from typing_extensions import override
@@ -78,4 +78,4 @@ class BaseImageManipulation(Plugin):
 
     @staticmethod
     def generate_file_name(file_extension: str = ".png") -> str:
-        return f"{uuid4()}{file_extension}"
+        return f"{token_urlsafe(16)}{file_extension}"
@@ -33,13 +33,12 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import TYPE_CHECKING, Tuple
 
 import discord
 from discord.ext import commands
 
-from src.imaging import AvatarCollage, FilePointer, PresenceGraph, PresenceHistory
+from src.imaging import AvatarCollage, FilePointer, PresenceGraph
 from src.shared import ExceptionFactory, MaybeMemberParam, Stopwatch
 
 from ._base import BaseImageManipulation
@@ -65,10 +64,10 @@ class ActivityHistory(BaseImageManipulation):
             raise ExceptionFactory.create_warning_exception(f"{user.display_name} has no avatar history.")
 
         with Stopwatch() as sw:
-            buffered_io = await AvatarCollage(pointer).buffer()
+            buffered_io = await AvatarCollage(pointer).buffer(self.serenity.process_pool)
             elapsed_time = sw.elapsed
 
-        filename = self.generate_file_name()
+        filename = self.generate_file_name(".webp")
         file = discord.File(buffered_io, filename=filename)
 
         embed = self.get_file_embed(
@@ -91,36 +90,30 @@ class ActivityHistory(BaseImageManipulation):
     async def presence_history(self, ctx: SerenityContext, user: discord.User = MaybeMemberParam) -> None:
         user = user or ctx.author
 
+        # Only the per-status totals are ever shown, so let PostgreSQL count them instead
+        # of shipping every presence change over the wire and tallying it here.
         query = """
             SELECT
                 status,
-                changed_at
+                COUNT(*)
             FROM
                 serenity_user_presence
             WHERE
                 snowflake = $1
-            ORDER BY
-                changed_at ASC
+            GROUP BY
+                status
         """
 
         async with self.serenity.pool.acquire() as conn:
-            async with conn.transaction(readonly=True):
-                results = await conn.fetch(query, user.id)
+            results = await conn.fetch(query, user.id)
 
         if not results:
             raise ExceptionFactory.create_warning_exception(f"{user.display_name} has no presence history.")
 
-        dates: list[datetime] = [result["changed_at"] for result in results]
-        statuses: list[str] = [result["status"] for result in results]
-        date_status_percentages: dict[str, float] = {}
-
-        for _, status in zip(dates, statuses):
-            if status not in date_status_percentages:
-                date_status_percentages[status] = 0.0
-
-            date_status_percentages[status] += 1.0 / len(dates)
-
-        presence = PresenceHistory(dates=dates, statuses=statuses)
+        # Column order is fixed by the query above, index positionally rather than by name.
+        presence: dict[str, int] = {result[0]: result[1] for result in results}
+        total = sum(presence.values())
+        date_status_percentages = {status: count / total for status, count in presence.items()}
 
         with Stopwatch() as sw:
             buffered_io = await PresenceGraph(presence).buffer()
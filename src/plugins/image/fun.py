@@ -125,7 +125,6 @@ class FunImageManipulation(BaseImageManipulation):
     )
     async def pride(self, ctx: SerenityContext, flag: str, user: discord.User = MaybeMemberParam) -> None:
         user = user or ctx.author
-        avatar = await self.get_avatar(user)
         maybe_flag = get_pride_type(flag)
 
         if maybe_flag is None:
@@ -134,6 +133,8 @@ class FunImageManipulation(BaseImageManipulation):
                 f"Valid flags are: {', '.join(f'`{flag}`' for flag in pride_options)}."
             )
 
+        avatar = await self.get_avatar(user)
+
         with Stopwatch() as sw:
             discord_file = await Canvas(avatar).to_canvas(CanvasOption.PRIDE, option=maybe_flag)
             elapsed_time = sw.elapsed
@@ -185,7 +186,8 @@ class FunImageManipulation(BaseImageManipulation):
         width = height = 256
 
         with Stopwatch() as sw:
-            bufferd_io = await self.serenity.to_thread(ColorRepresentation(width, height, rgb_color).raw)
+            # The PNG is deflated in the constructor, so build it in the worker thread as well.
+            bufferd_io = await self.serenity.to_thread(lambda: ColorRepresentation(width, height, rgb_color).raw())
             elapsed_time = sw.elapsed
 
         file_name = self.generate_file_name()
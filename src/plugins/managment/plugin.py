@@ -33,7 +33,6 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 
 from __future__ import annotations
 
-from io import StringIO
 from logging import getLogger
 from typing import TYPE_CHECKING, Optional, Tuple
 
@@ -98,21 +97,15 @@ class Managment(Plugin):
 
         guild = await self.serenity.get_or_create_guild(ctx.guild.id)
 
-        buffered_io = StringIO()
+        header = f'```prolog\n=== Prefixes for "{ctx.guild.name}" ===\n\nPrefixes:\n'
 
-        buffered_io.write('```prolog\n')
-        buffered_io.write(f'=== Prefixes for "{ctx.guild.name}" ===\n')
-        buffered_io.write("\nPrefixes:\n")
+        if not guild.prefixes:
+            await ctx.maybe_reply(f"{header}No prefixes have been set for this guild.\n```")
+            return
 
-        if len(guild.prefixes) == 0:
-            buffered_io.write("No prefixes have been set for this guild.\n")
+        listing = "".join(f"・ '{prefix}'\n" for prefix in guild.prefixes)
 
-        for prefix in guild.prefixes:
-            buffered_io.write(f"・ '{prefix}'\n")
-
-        buffered_io.write('```')
-
-        await ctx.maybe_reply(buffered_io.getvalue())
+        await ctx.maybe_reply(f"{header}{listing}```")
 
     @commands.has_guild_permissions(manage_guild=True)
     @prefix.command(name="remove", aliases=("rm",), extras=prefix_remove_extra, brief="Remove a prefix for this guild.")
@@ -35,6 +35,7 @@ from __future__ import annotations
 
 import asyncio
 import subprocess
+from contextlib import suppress
 from sys import version_info
 from typing import TYPE_CHECKING, Optional, Tuple
 
@@ -54,6 +55,18 @@ if TYPE_CHECKING:
 
 __all__: Tuple[str, ...] = ("Meta",)
 
+_ABOUT_DESCRIPTION = "\n\n".join(
+    (
+        "{name} comes equipped with a variety of features to make your server experience even better. "
+        "With this valuable information at your fingertips, you'll never miss a beat when it comes to "
+        "staying up-to-date with your community.",
+        "Whether you're a seasoned Discord user or just starting out, {name} is the perfect addition to any server.",
+    )
+)
+
+# Discord caps a message at 2000 characters.
+_UWU_OUTPUT_LIMIT = 2000
+
 
 @for_command_callbacks(commands.cooldown(1, 5, commands.BucketType.user))
 class Meta(Plugin):
@@ -63,21 +76,25 @@ class Meta(Plugin):
     def __init__(self, serenity: Serenity) -> None:
         self.serenity = serenity
 
-    @commands.command(name="about", aliases=("info", "botinfo", "bot"), extras=bot_info_extra)
-    async def about(self, ctx: SerenityContext) -> None:
-        me = ctx.me
-        python_version = f"{version_info.major}.{version_info.minor}.{version_info.micro}"
-        discord_version = discord.__version__
-        lines_of_code = await self.serenity.to_thread(count_source_lines)
-
+    async def _probe_postgres(self) -> Tuple[str, float]:
         async with self.serenity.pool.acquire() as conn:
             async with conn.transaction(readonly=True):
                 with Stopwatch() as sw:
                     psql_version = await conn.fetchval("SELECT version();")
                     psql_latency = sw.elapsed
 
-                psql_version = psql_version.split()[1:2]
-                psql_version = "".join(psql_version)
+        return "".join(psql_version.split()[1:2]), psql_latency
+
+    @commands.command(name="about", aliases=("info", "botinfo", "bot"), extras=bot_info_extra)
+    async def about(self, ctx: SerenityContext) -> None:
+        me = ctx.me
+        avatar_url = me.display_avatar.url
+        python_version = f"{version_info.major}.{version_info.minor}.{version_info.micro}"
+        discord_version = discord.__version__
+        lines_of_code, (psql_version, psql_latency) = await asyncio.gather(
+            self.serenity.to_thread(count_source_lines),
+            self._probe_postgres(),
+        )
 
         fields: Tuple[Tuple[str, str, bool], ...] = (
             ("Python", python_version, True),
@@ -91,23 +108,13 @@ class Meta(Plugin):
         embed = (
             SerenityEmbed.factory(
                 ctx,
-                description=(
-                    f"""
-                    {me.name} comes equipped with a variety of features to make 
-                    your server experience even better. With this valuable 
-                    information at your fingertips, you'll never miss a beat when 
-                    it comes to staying up-to-date with your community.
-
-                    Whether you're a seasoned Discord user or just starting out, 
-                    {me.name} is the perfect addition to any server.
-                    """
-                ),
+                description=_ABOUT_DESCRIPTION.format(name=me.name),
                 fields=fields,
             )
-            .set_thumbnail(url=me.display_avatar.url)
+            .set_thumbnail(url=avatar_url)
             .set_author(
                 name=f"{me.display_name} Information",
-                icon_url=me.display_avatar.url,
+                icon_url=avatar_url,
             )
         )
 
@@ -119,17 +126,19 @@ class Meta(Plugin):
     @commands.command(name="avatar", aliases=("av", "pfp"), extras=avatar_info_extra)
     async def avatar(self, ctx: SerenityContext, *, member: discord.User = MaybeMemberParam) -> None:
         user = member or ctx.author
+        avatar = user.display_avatar
+        avatar_url = avatar.url
 
-        webp = user.display_avatar.with_format("webp").url
-        png = user.display_avatar.with_format("png").url
-        jpg = user.display_avatar.with_format("jpg").url
-        gif = user.display_avatar.url if user.display_avatar.is_animated() else None
+        webp = avatar.with_format("webp").url
+        png = avatar.with_format("png").url
+        jpg = avatar.with_format("jpg").url
+        gif = avatar_url if avatar.is_animated() else None
 
         embed = SerenityEmbed(
             description=f"[webp]({webp}) | [png]({png}) | [jpg]({jpg}) {f'| [gif]({gif})' if gif else ''}"
         )
-        embed.set_author(name=f"{user.display_name}'s avatar", icon_url=user.display_avatar)
-        embed.set_image(url=user.display_avatar.url)
+        embed.set_author(name=f"{user.display_name}'s avatar", icon_url=avatar_url)
+        embed.set_image(url=avatar_url)
 
         await ctx.maybe_reply(embed=embed)
 
@@ -159,9 +168,40 @@ class Meta(Plugin):
             stderr=subprocess.PIPE,
         )
 
-        stdout, stderr = await proc.communicate()
+        if proc.stdout is None or proc.stderr is None:
+            raise RuntimeError("uwuifyy was started without its output pipes")
+
+        async def read_stdout(stream: asyncio.StreamReader) -> bytes:
+            try:
+                output = await stream.readexactly(_UWU_OUTPUT_LIMIT)
+            except asyncio.IncompleteReadError as exc:
+                return exc.partial
+
+            # Anything past a single message would be thrown away, stop the process there.
+            with suppress(ProcessLookupError):
+                proc.kill()
+
+            return output
+
+        try:
+            # Both pipes are drained together so a chatty stderr can't stall stdout.
+            stdout, stderr = await asyncio.wait_for(
+                asyncio.gather(read_stdout(proc.stdout), proc.stderr.read()),
+                timeout=10,
+            )
+        except asyncio.TimeoutError:
+            with suppress(ProcessLookupError):
+                proc.kill()
+
+            await proc.wait()
+            return await ctx.maybe_reply("Owoifying that took too long, pwease twy again")
+
+        await proc.wait()
 
         if stderr:
-            return await ctx.maybe_reply(f"Error: {stderr.decode()}")
+            return await ctx.maybe_reply(f"Error: {stderr.decode(errors='ignore')[:_UWU_OUTPUT_LIMIT - 7]}")
+
+        if not (output := stdout.decode(errors="ignore").strip()):
+            return await ctx.maybe_reply("Cowldn't owoify that tewxt")
 
-        await ctx.maybe_reply(stdout.decode())
+        await ctx.maybe_reply(output)
@@ -34,11 +34,11 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 from __future__ import annotations
 
 import inspect
-import re
 import textwrap
 from logging import getLogger
 from os import environ
 from pathlib import Path
+from string import hexdigits
 from subprocess import PIPE, Popen
 from typing import TYPE_CHECKING, Any, Dict, Final, List, NamedTuple, Optional, Tuple
 
@@ -65,6 +65,21 @@ LICENSE: Final[str] = "https://creativecommons.org/licenses/by-nc-sa/4.0/"
 
 _logger = getLogger(__name__)
 
+# Built once at import, the source command only has to fill in the blanks.
+_SOURCE_TEMPLATE: Final[str] = "\n".join(
+    (
+        "",
+        "<{link}>",
+        "```prolog",
+        '=== Source code for "{object}" ===',
+        "",
+        "{module} ({filename})",
+        "Lines: {lines}",
+        "```",
+        "",
+    )
+)
+
 
 class SourceInformation(NamedTuple):
     url: str
@@ -82,12 +97,9 @@ def count_source_lines() -> int:
             if path.suffix in ignored:
                 return 0
 
-            with path.open("r", encoding="utf-8") as file:
-                try:
-                    return len(file.readlines())
-                except UnicodeDecodeError:
-                    _logger.warning(f"Failed to read {path} as UTF-8.")
-                    return 0
+            # Counting newlines doesn't need the text, so skip decoding it altogether.
+            with path.open("rb") as file:
+                return sum(1 for _ in file)
 
         elif path.is_dir():
             if path.name.startswith("__"):
@@ -100,6 +112,25 @@ def count_source_lines() -> int:
     return count_lines(Path("src"))
 
 
+def _read_branch() -> Optional[str]:
+    try:
+        head = Path(".git", "HEAD").read_text(encoding="ascii").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    ref, _, name = head.partition("refs/heads/")
+
+    if ref == "ref: " and name:
+        return name
+
+    # A detached HEAD holds a bare commit hash (SHA-1 or SHA-256), which git reports as "HEAD".
+    if len(head) in (40, 64) and all(char in hexdigits for char in head):
+        return "HEAD"
+
+    # Anything else, such as a ref outside refs/heads, is left to git itself.
+    return None
+
+
 def get_git_history():
     def ext_command(command: List[str]) -> bytes:
         env: Dict[str, Any] = {}
@@ -121,8 +152,11 @@ def get_git_history():
         return out
 
     try:
-        first = ext_command(["git", "rev-parse", "--abbrev-ref", "HEAD"])
-        branch = first.strip().decode("ascii")
+        branch = _read_branch()
+
+        if branch is None:
+            first = ext_command(["git", "rev-parse", "--abbrev-ref", "HEAD"])
+            branch = first.strip().decode("ascii")
 
         second = ext_command(["git", "log", "--oneline", "-5"])
         history = second.strip().decode("ascii")
@@ -190,14 +224,4 @@ class SourceCode:
         filename = filename.split("bot/")[1].replace("\\", "/")
         link = self._generate_source_link(self.object, filename)
 
-        fmt = f"""
-            <{link}>
-            ```prolog
-            === Source code for "{self.object}" ===
-
-            {module} ({filename})
-            Lines: {lines}
-            ```
-            """
-
-        return re.sub(r"(?m)^ {12}", "", fmt)
+        return _SOURCE_TEMPLATE.format(link=link, object=self.object, module=module, filename=filename, lines=lines)
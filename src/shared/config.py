@@ -32,6 +32,7 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 """
 
 from collections import deque
+from functools import lru_cache
 from logging import Logger, getLogger
 from typing import AbstractSet, Any, Generator, Type
 
@@ -40,7 +41,7 @@ from pydantic import BaseSettings
 from pydantic.fields import ModelField
 from typing_extensions import override
 
-__all__: tuple[str, ...] = ("SerenityConfig",)
+__all__: tuple[str, ...] = ("SerenityConfig", "get_config")
 
 
 _logger: Logger = getLogger(__name__)
@@ -133,3 +134,9 @@ class SerenityConfig(BaseSettings):
             if not cls.case_sensitive:
                 env_names = env_names.__class__(n.lower() for n in env_names)
             field.field_info.extra["env_names"] = env_names
+
+
+@lru_cache(maxsize=None)
+def get_config() -> SerenityConfig:
+    """Reads the environment and ``.env`` file once, every caller shares the result."""
+    return SerenityConfig.parse_obj({})
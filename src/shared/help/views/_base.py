@@ -40,7 +40,7 @@ from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, ParamSpec, Tu
 from discord import Interaction, Member, User
 from discord.ext import commands
 
-from src.shared import CommandExtras, SerenityConfig, SerenityView
+from src.shared import CommandExtras, SerenityView, get_config
 
 if TYPE_CHECKING:
     from src.models.discord import SerenityContext
@@ -49,7 +49,7 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 P = ParamSpec("P")
-Config = SerenityConfig.parse_obj({})
+Config = get_config()
 
 
 class PluginItem(NamedTuple):
@@ -33,12 +33,11 @@ at https://creativecommons.org/licenses/by-nc-sa/4.0/legalcode
 
 from __future__ import annotations
 
+from os import urandom
 from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar
-from uuid import uuid4
 
 from discord.app_commands import Command as AppCommand
 from discord.ext import commands
-from discord.utils import async_all
 from typing_extensions import override
 
 if TYPE_CHECKING:
@@ -59,12 +58,11 @@ class Plugin(commands.Cog):
 
     @override
     async def cog_check(self, ctx: SerenityContext) -> bool:  # type: ignore
-        checks = (commands.guild_only(),)
-        return await async_all(check(ctx) for check in checks)
+        return ctx.guild is not None
 
     def __init__(self, serinity: Serenity, *args: Any, **kwargs: Any) -> None:
         self.serenity = serinity
-        self.id = uuid4()
+        self.id = urandom(4).hex()
         next_in_method_resolution_order = next(iter(self.__class__.__mro__))
 
         if issubclass(next_in_method_resolution_order, self.__class__):
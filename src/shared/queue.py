@@ -71,3 +71,13 @@ class SerenityQueue(Queue[T]):
                 break
 
         return items
+
+    def drain(self) -> list[T]:
+        """Remove and return every item currently queued without suspending."""
+        items: list[T] = []
+
+        while True:
+            try:
+                items.append(self.get_nowait())
+            except QueueEmpty:
+                return items